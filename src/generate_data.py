@@ -96,6 +96,7 @@ JOB_TITLES = {
     'HR': ['HR Director', 'HR Manager', 'Recruiter', 'Talent Acquisition Specialist', 'HR Generalist'],
     'Operations': ['Operations Manager', 'Project Manager', 'Supply Chain Manager', 'Logistics Coordinator'],
 }
+JOB_DEPARTMENTS = tuple(JOB_TITLES.keys())
 
 DEAL_STAGES = {
     'prospecting': 10,
@@ -105,6 +106,7 @@ DEAL_STAGES = {
     'closed_won': 100,
     'closed_lost': 0,
 }
+DEAL_STAGE_NAMES = tuple(DEAL_STAGES.keys())
 
 PRODUCT_CATEGORIES = [
     'Software', 'Hardware', 'Services', 'Support', 'Training',
@@ -190,23 +192,20 @@ def generate_contacts(conn, company_ids, count):
     print(f"Generating {count} contacts...")
     contact_ids = []
     contact_company_map = {}
-    used_emails = set()
+
+    # Suffix emails with numbers past the highest existing contact id so they
+    # stay unique across runs without a retry loop
+    id_offset = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM contacts")).scalar()
 
     for i in range(count):
         company_id = random.choice(company_ids)
-        department = random.choice(list(JOB_TITLES.keys()))
+        department = random.choice(JOB_DEPARTMENTS)
         title = random.choice(JOB_TITLES[department])
 
         first_name = fake.first_name()
         last_name = fake.last_name()
 
-        base_email = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
-        email = base_email
-        counter = 1
-        while email in used_emails:
-            email = f"{first_name.lower()}.{last_name.lower()}{counter}@{fake.domain_name()}"
-            counter += 1
-        used_emails.add(email)
+        email = f"{first_name.lower()}.{last_name.lower()}.{id_offset + i + 1}@{fake.domain_name()}"
 
         result = conn.execute(
             text("""
@@ -223,7 +222,7 @@ def generate_contacts(conn, company_ids, count):
                 'mobile': fake.phone_number(),
                 'title': title,
                 'department': department,
-                'linkedin_url': f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{fake.uuid4()[:8]}",
+                'linkedin_url': f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{random.getrandbits(32):08x}",
                 'is_primary': i % 5 == 0,
                 'created_at': fake.date_time_between(start_date='-2y', end_date='now'),
             }
@@ -286,12 +285,17 @@ def generate_deals(conn, company_ids, contact_ids, contact_company_map, count):
     print(f"Generating {count} deals...")
     deal_ids = []
 
+    # Invert contact -> company once so each deal looks up its contacts directly
+    company_to_contacts = {}
+    for cid, comp_id in contact_company_map.items():
+        company_to_contacts.setdefault(comp_id, []).append(cid)
+
     for _ in range(count):
         company_id = random.choice(company_ids)
-        company_contacts = [cid for cid, comp_id in contact_company_map.items() if comp_id == company_id]
+        company_contacts = company_to_contacts.get(company_id, ())
         contact_id = random.choice(company_contacts) if company_contacts else None
 
-        stage = random.choice(list(DEAL_STAGES.keys()))
+        stage = random.choice(DEAL_STAGE_NAMES)
         probability = DEAL_STAGES[stage]
         if stage not in ('closed_won', 'closed_lost'):
             probability = max(0, min(100, probability + random.randint(-10, 10)))
@@ -333,17 +337,16 @@ def generate_deal_products(conn, deal_ids, product_data, count):
     """Generate deal-product associations."""
     print(f"Generating {count} deal-product associations...")
     deal_products = []
-    used_pairs = set()
     product_ids = list(product_data.keys())
 
-    while len(deal_products) < count:
-        deal_id = random.choice(deal_ids)
-        product_id = random.choice(product_ids)
+    # Sample distinct (deal, product) pairs by index into their Cartesian product
+    num_products = len(product_ids)
+    total_pairs = len(deal_ids) * num_products
+    pair_indexes = random.sample(range(total_pairs), min(count, total_pairs))
 
-        pair = (deal_id, product_id)
-        if pair in used_pairs:
-            continue
-        used_pairs.add(pair)
+    for pair_index in pair_indexes:
+        deal_id = deal_ids[pair_index // num_products]
+        product_id = product_ids[pair_index % num_products]
 
         base_price = product_data[product_id]
         unit_price = base_price * Decimal(random.uniform(0.8, 1.2))
@@ -2,23 +2,45 @@
 """
 CRM Database Data Generator - SQL Output Mode
 
-Generates synthetic CRM data using Faker and outputs SQL INSERT statements.
+Generates synthetic CRM data using Faker and Mimesis and outputs SQL INSERT
+statements.
 This can be imported via gcloud sql import sql.
+
+Requires the extra packages in requirements-sql.txt:
+    pip install -r requirements-sql.txt
 """
 
+import io
+import multiprocessing
 import os
 import random
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from decimal import Decimal
 
 from faker import Faker
+from mimesis import Finance, Person, Text
+from mimesis.locales import Locale
 
 # Initialize Faker
 fake = Faker()
 Faker.seed(42)  # For reproducibility
 random.seed(42)
 
+# Mimesis is much faster than Faker; use it for the providers called per row.
+# Faker remains for providers without a Mimesis equivalent (bs, url, address)
+# and for company names: Mimesis draws those from ~1,100 real brands, which
+# repeat quickly at larger company counts. Its brands are only used for the
+# competitor mentioned in notes.
+person = Person(Locale.EN, seed=42)
+finance = Finance(Locale.EN, seed=42)
+text = Text(Locale.EN, seed=42)
+
+# Pre-generated pools for values that don't need to be unique per row
+PHONE_POOL = [person.telephone() for _ in range(2000)]
+DOMAIN_POOL = [fake.domain_name() for _ in range(500)]
+
 # Configuration - record counts
 CONFIG = {
     'companies': 100,
@@ -31,6 +53,31 @@ CONFIG = {
     'tasks': 150,
 }
 
+# Rows per multi-row INSERT statement
+BATCH_SIZE = 1000
+
+# INSERT statement prefixes; each batch appends its comma-joined VALUES tuples
+COMPANIES_INSERT = "INSERT INTO companies (id, name, industry, website, address, city, state, country, postal_code, phone, employee_count, annual_revenue, created_at) VALUES "
+CONTACTS_INSERT = "INSERT INTO contacts (id, company_id, first_name, last_name, email, phone, mobile, title, department, linkedin_url, is_primary, created_at) VALUES "
+PRODUCTS_INSERT = "INSERT INTO products (id, name, description, price, sku, category, is_active, created_at) VALUES "
+DEALS_INSERT = "INSERT INTO deals (id, company_id, contact_id, title, description, value, stage, probability, expected_close_date, actual_close_date, source, created_at) VALUES "
+DEAL_PRODUCTS_INSERT = "INSERT INTO deal_products (id, deal_id, product_id, quantity, unit_price, discount_percent) VALUES "
+ACTIVITIES_INSERT = "INSERT INTO activities (id, contact_id, type, subject, notes, duration_minutes, activity_date) VALUES "
+NOTES_INSERT = "INSERT INTO notes (id, contact_id, content, created_at) VALUES "
+TASKS_INSERT = "INSERT INTO tasks (id, deal_id, title, description, due_date, status, priority, completed_at, created_at) VALUES "
+
+# SQL output goes straight to the stdout file descriptor in chunks of this size
+STDOUT_FD = 1
+OUTPUT_CHUNK_SIZE = 65536
+
+# Timestamp formats used when rendering SQL literals
+_DT_FMT = '%Y-%m-%d %H:%M:%S'
+_DATE_FMT = '%Y-%m-%d'
+
+# Bounds for sampling timestamps as plain epoch integers
+NOW_TS = int(datetime.now().timestamp())
+DAY_SECONDS = 86400
+
 # Industry options
 INDUSTRIES = [
     'Technology', 'Healthcare', 'Finance', 'Manufacturing', 'Retail',
@@ -49,6 +96,7 @@ JOB_TITLES = {
     'HR': ['HR Director', 'HR Manager', 'Recruiter', 'Talent Acquisition Specialist', 'HR Generalist'],
     'Operations': ['Operations Manager', 'Project Manager', 'Supply Chain Manager', 'Logistics Coordinator'],
 }
+JOB_DEPARTMENTS = tuple(JOB_TITLES.keys())
 
 DEAL_STAGES = {
     'prospecting': 10,
@@ -58,112 +106,214 @@ DEAL_STAGES = {
     'closed_won': 100,
     'closed_lost': 0,
 }
+DEAL_STAGE_NAMES = tuple(DEAL_STAGES.keys())
 
 PRODUCT_CATEGORIES = [
     'Software', 'Hardware', 'Services', 'Support', 'Training',
     'Consulting', 'Subscription', 'License', 'Integration', 'Custom Development'
 ]
 
-ACTIVITY_TYPES = ['call', 'email', 'meeting', 'demo', 'follow_up']
-TASK_PRIORITIES = ['low', 'medium', 'high', 'urgent']
+ACTIVITY_TYPES = ('call', 'email', 'meeting', 'demo', 'follow_up')
+TASK_PRIORITIES = ('low', 'medium', 'high', 'urgent')
 TASK_STATUSES = ['pending', 'in_progress', 'completed', 'cancelled']
 DEAL_SOURCES = [
     'Website', 'Referral', 'Cold Call', 'Trade Show', 'Social Media',
     'Email Campaign', 'Partner', 'Advertisement', 'Inbound', 'Outbound'
 ]
+# Zero is weighted by repetition so most line items are undiscounted
+DISCOUNT_PERCENTS = (0, 0, 0, 5, 10, 15, 20)
 
 
 def escape_sql(value):
     """Escape a value for SQL."""
+    # Strings are by far the most common input, so check them first
+    if type(value) is str:
+        return "'" + value.replace("'", "''") + "'"
     if value is None:
         return 'NULL'
     if isinstance(value, bool):
         return 'TRUE' if value else 'FALSE'
-    if isinstance(value, (int, float, Decimal)):
+    if isinstance(value, (int, float)):
         return str(value)
     if isinstance(value, datetime):
-        return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+        return "'" + value.strftime(_DT_FMT) + "'"
     if hasattr(value, 'strftime'):  # date objects
-        return f"'{value.strftime('%Y-%m-%d')}'"
-    # String - escape single quotes
+        return "'" + value.strftime(_DATE_FMT) + "'"
+    # Other types (including str subclasses) - escape single quotes
     return "'" + str(value).replace("'", "''") + "'"
 
 
-def generate_companies(count):
+_NON_ALNUM_SUB = re.compile(r'[^a-z0-9]').sub
+
+
+def slug(value):
+    """Lowercase a name and drop everything but ASCII letters and digits."""
+    return _NON_ALNUM_SUB('', value.lower())
+
+
+def format_cents(cents):
+    """Render an integer amount of cents as a NUMERIC literal."""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+# Constant tables escaped once at import. Tuples are sampled directly; dicts map
+# a raw value (still needed for lookups and comparisons) to its SQL literal.
+INDUSTRIES_SQL = tuple(escape_sql(v) for v in INDUSTRIES)
+DEAL_SOURCES_SQL = tuple(escape_sql(v) for v in DEAL_SOURCES)
+TASK_PRIORITIES_SQL = tuple(escape_sql(v) for v in TASK_PRIORITIES)
+JOB_TITLES_SQL = {dept: tuple(escape_sql(t) for t in titles) for dept, titles in JOB_TITLES.items()}
+JOB_DEPARTMENTS_SQL = {v: escape_sql(v) for v in JOB_DEPARTMENTS}
+DEAL_STAGES_SQL = {v: escape_sql(v) for v in DEAL_STAGE_NAMES}
+PRODUCT_CATEGORIES_SQL = {v: escape_sql(v) for v in PRODUCT_CATEGORIES}
+ACTIVITY_TYPES_SQL = {v: escape_sql(v) for v in ACTIVITY_TYPES}
+TASK_STATUSES_SQL = {v: escape_sql(v) for v in TASK_STATUSES}
+
+# Pre-generated, pre-escaped deal titles
+BS_POOL = tuple(escape_sql(f"{fake.bs().title()} Project") for _ in range(500))
+
+
+def random_dt(start_ts, end_ts):
+    """Return a random SQL timestamp string between two epoch times."""
+    return datetime.fromtimestamp(random.randint(start_ts, end_ts)).strftime(_DT_FMT)
+
+
+def fast_dt(delta_days):
+    """Return a random SQL timestamp string within the last delta_days days."""
+    return random_dt(NOW_TS - delta_days * DAY_SECONDS, NOW_TS)
+
+
+def paragraph(nb_sentences):
+    """Return a paragraph of random sentences."""
+    return " ".join(text.sentence() for _ in range(nb_sentences))
+
+
+def emit_batch(out, prefix, rows, batch_size=BATCH_SIZE):
+    """Write multi-row INSERT statements to out, batch_size rows per statement."""
+    out.writelines(
+        prefix + ",".join(rows[start:start + batch_size]) + ";\n"
+        for start in range(0, len(rows), batch_size)
+    )
+
+
+def flush_output(buf):
+    """Write buffered SQL to stdout and reset the buffer."""
+    data = memoryview(buf.getvalue().encode('utf-8'))
+    while data:
+        written = os.write(STDOUT_FD, data[:OUTPUT_CHUNK_SIZE])
+        data = data[written:]
+    buf.seek(0)
+    buf.truncate()
+
+
+def generate_in_worker(seed, generator, *args):
+    """Run a generator in a worker process and return its SQL and result."""
+    # Give each worker its own random stream so tables don't repeat each other
+    random.seed(seed)
+    Faker.seed(seed)
+    for provider in (person, finance, text):
+        provider.reseed(seed)
+
+    out = io.StringIO()
+    result = generator(out, *args)
+    return out.getvalue(), result
+
+
+def generate_companies(out, count):
     """Generate company INSERT statements."""
     print(f"-- Generating {count} companies", file=sys.stderr)
-    print("\n-- Companies")
+    out.write("\n-- Companies\n")
 
+    # Draw per-row random selections in one call each
+    industries = random.choices(INDUSTRIES_SQL, k=count)
+    employee_counts = random.choices(range(10, 10001), k=count)
+    annual_revenues = random.choices(range(100000, 100000001), k=count)
+    phones = random.choices(PHONE_POOL, k=count)
+
+    rows = []
     for i in range(1, count + 1):
         name = escape_sql(fake.company())
-        industry = escape_sql(random.choice(INDUSTRIES))
+        industry = industries[i - 1]
         website = escape_sql(fake.url())
         address = escape_sql(fake.street_address())
         city = escape_sql(fake.city())
         state = escape_sql(fake.state_abbr())
-        country = escape_sql('USA')
+        country = "'USA'"
         postal_code = escape_sql(fake.zipcode())
-        phone = escape_sql(fake.phone_number())
-        employee_count = random.randint(10, 10000)
-        annual_revenue = f"{random.randint(100000, 100000000)}.00"
-        created_at = escape_sql(fake.date_time_between(start_date='-3y', end_date='now'))
+        phone = escape_sql(phones[i - 1])
+        employee_count = employee_counts[i - 1]
+        annual_revenue = f"{annual_revenues[i - 1]}.00"
+        created_at = "'" + fast_dt(3 * 365) + "'"
+
+        rows.append(f"({i}, {name}, {industry}, {website}, {address}, {city}, {state}, {country}, {postal_code}, {phone}, {employee_count}, {annual_revenue}, {created_at})")
 
-        print(f"INSERT INTO companies (id, name, industry, website, address, city, state, country, postal_code, phone, employee_count, annual_revenue, created_at) VALUES ({i}, {name}, {industry}, {website}, {address}, {city}, {state}, {country}, {postal_code}, {phone}, {employee_count}, {annual_revenue}, {created_at});")
+    emit_batch(out, COMPANIES_INSERT, rows)
 
     # Reset sequence
-    print(f"SELECT setval('companies_id_seq', {count});")
+    out.write(f"SELECT setval('companies_id_seq', {count});\n")
     return list(range(1, count + 1))
 
 
-def generate_contacts(company_ids, count):
+def generate_contacts(out, company_ids, count):
     """Generate contact INSERT statements."""
     print(f"-- Generating {count} contacts", file=sys.stderr)
-    print("\n-- Contacts")
+    out.write("\n-- Contacts\n")
 
-    used_emails = set()
     contact_company_map = {}
 
+    picked_companies = random.choices(company_ids, k=count)
+    departments = random.choices(JOB_DEPARTMENTS, k=count)
+    domains = random.choices(DOMAIN_POOL, k=count)
+    phones = random.choices(PHONE_POOL, k=count)
+    mobiles = random.choices(PHONE_POOL, k=count)
+
+    rows = []
     for i in range(1, count + 1):
-        company_id = random.choice(company_ids)
+        company_id = picked_companies[i - 1]
         contact_company_map[i] = company_id
-        department = random.choice(list(JOB_TITLES.keys()))
-        title = random.choice(JOB_TITLES[department])
+        department = departments[i - 1]
+        title = random.choice(JOB_TITLES_SQL[department])
 
-        first_name = fake.first_name()
-        last_name = fake.last_name()
+        first_name = person.first_name()
+        last_name = person.last_name()
 
-        base_email = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
-        email = base_email
-        counter = 1
-        while email in used_emails:
-            email = f"{first_name.lower()}.{last_name.lower()}{counter}@{fake.domain_name()}"
-            counter += 1
-        used_emails.add(email)
+        # Names like O'Brien would put quotes in the email and URL
+        first_slug = slug(first_name)
+        last_slug = slug(last_name)
+
+        # The contact id makes every email unique without retries
+        email = f"{first_slug}.{last_slug}.{i}@{domains[i - 1]}"
 
         is_primary = 'TRUE' if i % 5 == 0 else 'FALSE'
-        created_at = escape_sql(fake.date_time_between(start_date='-2y', end_date='now'))
-        linkedin = escape_sql(f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{fake.uuid4()[:8]}")
+        created_at = "'" + fast_dt(2 * 365) + "'"
+        linkedin = escape_sql(f"https://linkedin.com/in/{first_slug}-{last_slug}-{random.getrandbits(32):08x}")
+
+        rows.append(f"({i}, {company_id}, {escape_sql(first_name)}, {escape_sql(last_name)}, {escape_sql(email)}, {escape_sql(phones[i - 1])}, {escape_sql(mobiles[i - 1])}, {title}, {JOB_DEPARTMENTS_SQL[department]}, {linkedin}, {is_primary}, {created_at})")
 
-        print(f"INSERT INTO contacts (id, company_id, first_name, last_name, email, phone, mobile, title, department, linkedin_url, is_primary, created_at) VALUES ({i}, {company_id}, {escape_sql(first_name)}, {escape_sql(last_name)}, {escape_sql(email)}, {escape_sql(fake.phone_number())}, {escape_sql(fake.phone_number())}, {escape_sql(title)}, {escape_sql(department)}, {linkedin}, {is_primary}, {created_at});")
+    emit_batch(out, CONTACTS_INSERT, rows)
 
-    print(f"SELECT setval('contacts_id_seq', {count});")
+    out.write(f"SELECT setval('contacts_id_seq', {count});\n")
     return list(range(1, count + 1)), contact_company_map
 
 
-def generate_products(count):
+def generate_products(out, count):
     """Generate product INSERT statements."""
     print(f"-- Generating {count} products", file=sys.stderr)
-    print("\n-- Products")
+    out.write("\n-- Products\n")
 
     product_prefixes = ['Pro', 'Enterprise', 'Basic', 'Premium', 'Ultimate', 'Starter', 'Business', 'Team']
     product_types = ['Suite', 'Platform', 'Solution', 'Package', 'Service', 'Module', 'Add-on', 'License']
     used_skus = set()
     product_prices = {}
 
+    prefixes = random.choices(product_prefixes, k=count)
+    prod_types = random.choices(product_types, k=count)
+    categories = random.choices(PRODUCT_CATEGORIES, k=count)
+
+    rows = []
     for i in range(1, count + 1):
-        prefix = random.choice(product_prefixes)
-        prod_type = random.choice(product_types)
-        category = random.choice(PRODUCT_CATEGORIES)
+        prefix = prefixes[i - 1]
+        prod_type = prod_types[i - 1]
+        category = categories[i - 1]
         name = f"{prefix} {category} {prod_type}"
 
         sku = f"{category[:3].upper()}-{random.randint(1000, 9999)}"
@@ -171,82 +321,101 @@ def generate_products(count):
             sku = f"{category[:3].upper()}-{random.randint(1000, 9999)}"
         used_skus.add(sku)
 
-        price = Decimal(random.randint(99, 99999)) + Decimal(random.randint(0, 99)) / 100
-        product_prices[i] = price
+        # Prices are kept in integer cents to avoid Decimal arithmetic
+        price_cents = random.randint(9900, 9999999)
+        product_prices[i] = price_cents
         is_active = 'TRUE' if random.random() > 0.1 else 'FALSE'
-        created_at = escape_sql(fake.date_time_between(start_date='-2y', end_date='now'))
+        created_at = "'" + fast_dt(2 * 365) + "'"
 
-        print(f"INSERT INTO products (id, name, description, price, sku, category, is_active, created_at) VALUES ({i}, {escape_sql(name)}, {escape_sql(fake.paragraph(nb_sentences=2))}, {price}, {escape_sql(sku)}, {escape_sql(category)}, {is_active}, {created_at});")
+        rows.append(f"({i}, {escape_sql(name)}, {escape_sql(paragraph(2))}, {format_cents(price_cents)}, {escape_sql(sku)}, {PRODUCT_CATEGORIES_SQL[category]}, {is_active}, {created_at})")
 
-    print(f"SELECT setval('products_id_seq', {count});")
+    emit_batch(out, PRODUCTS_INSERT, rows)
+
+    out.write(f"SELECT setval('products_id_seq', {count});\n")
     return list(range(1, count + 1)), product_prices
 
 
-def generate_deals(company_ids, contact_ids, contact_company_map, count):
+def generate_deals(out, company_ids, contact_ids, contact_company_map, count):
     """Generate deal INSERT statements."""
     print(f"-- Generating {count} deals", file=sys.stderr)
-    print("\n-- Deals")
+    out.write("\n-- Deals\n")
+
+    # Invert contact -> company once so each deal looks up its contacts directly
+    company_to_contacts = {}
+    for cid, comp_id in contact_company_map.items():
+        company_to_contacts.setdefault(comp_id, []).append(cid)
+
+    # Draw per-row random selections in one call each
+    stages = random.choices(DEAL_STAGE_NAMES, k=count)
+    sources = random.choices(DEAL_SOURCES_SQL, k=count)
+    values = random.choices(range(1000, 500001), k=count)
+    picked_companies = random.choices(company_ids, k=count)
+    titles = random.choices(BS_POOL, k=count)
 
+    rows = []
     for i in range(1, count + 1):
-        company_id = random.choice(company_ids)
-        company_contacts = [cid for cid, comp_id in contact_company_map.items() if comp_id == company_id]
+        company_id = picked_companies[i - 1]
+        company_contacts = company_to_contacts.get(company_id, ())
         contact_id = random.choice(company_contacts) if company_contacts else 'NULL'
 
-        stage = random.choice(list(DEAL_STAGES.keys()))
+        stage = stages[i - 1]
         probability = DEAL_STAGES[stage]
         if stage not in ('closed_won', 'closed_lost'):
             probability = max(0, min(100, probability + random.randint(-10, 10)))
 
-        value = Decimal(random.randint(1000, 500000))
+        value = values[i - 1]
         expected_close = escape_sql(fake.date_between(start_date='-6m', end_date='+6m'))
 
         actual_close = 'NULL'
         if stage in ('closed_won', 'closed_lost'):
             actual_close = escape_sql(fake.date_between(start_date='-6m', end_date='today'))
 
-        title = escape_sql(f"{fake.bs().title()} Project")
-        description = escape_sql(fake.paragraph(nb_sentences=2))
-        source = escape_sql(random.choice(DEAL_SOURCES))
-        created_at = escape_sql(fake.date_time_between(start_date='-1y', end_date='now'))
+        title = titles[i - 1]
+        description = escape_sql(paragraph(2))
+        source = sources[i - 1]
+        created_at = "'" + fast_dt(365) + "'"
 
-        print(f"INSERT INTO deals (id, company_id, contact_id, title, description, value, stage, probability, expected_close_date, actual_close_date, source, created_at) VALUES ({i}, {company_id}, {contact_id}, {title}, {description}, {value}, {escape_sql(stage)}, {probability}, {expected_close}, {actual_close}, {source}, {created_at});")
+        rows.append(f"({i}, {company_id}, {contact_id}, {title}, {description}, {value}, {DEAL_STAGES_SQL[stage]}, {probability}, {expected_close}, {actual_close}, {source}, {created_at})")
 
-    print(f"SELECT setval('deals_id_seq', {count});")
+    emit_batch(out, DEALS_INSERT, rows)
+
+    out.write(f"SELECT setval('deals_id_seq', {count});\n")
     return list(range(1, count + 1))
 
 
-def generate_deal_products(deal_ids, product_ids, product_prices, count):
+def generate_deal_products(out, deal_ids, product_ids, product_prices, count):
     """Generate deal_products INSERT statements."""
     print(f"-- Generating {count} deal-product associations", file=sys.stderr)
-    print("\n-- Deal Products")
-
-    used_pairs = set()
-    dp_id = 0
-
-    while dp_id < count:
-        deal_id = random.choice(deal_ids)
-        product_id = random.choice(product_ids)
-
-        pair = (deal_id, product_id)
-        if pair in used_pairs:
-            continue
-        used_pairs.add(pair)
-        dp_id += 1
-
-        base_price = product_prices[product_id]
-        unit_price = round(base_price * Decimal(random.uniform(0.8, 1.2)), 2)
+    out.write("\n-- Deal Products\n")
+
+    # Sample distinct (deal, product) pairs by index into their Cartesian product
+    num_products = len(product_ids)
+    total_pairs = len(deal_ids) * num_products
+    pair_count = min(count, total_pairs)
+    pair_indexes = random.sample(range(total_pairs), pair_count)
+    discounts = random.choices(DISCOUNT_PERCENTS, k=pair_count)
+
+    rows = []
+    for dp_id, pair_index in enumerate(pair_indexes, start=1):
+        deal_id = deal_ids[pair_index // num_products]
+        product_id = product_ids[pair_index % num_products]
+
+        base_cents = product_prices[product_id]
+        unit_price = format_cents(base_cents * random.randint(80, 120) // 100)
         quantity = random.randint(1, 20)
-        discount = random.choice([0, 0, 0, 5, 10, 15, 20])
+        discount = discounts[dp_id - 1]
+
+        rows.append(f"({dp_id}, {deal_id}, {product_id}, {quantity}, {unit_price}, {discount})")
 
-        print(f"INSERT INTO deal_products (id, deal_id, product_id, quantity, unit_price, discount_percent) VALUES ({dp_id}, {deal_id}, {product_id}, {quantity}, {unit_price}, {discount});")
+    emit_batch(out, DEAL_PRODUCTS_INSERT, rows)
 
-    print(f"SELECT setval('deal_products_id_seq', {dp_id});")
+    out.write(f"SELECT setval('deal_products_id_seq', {pair_count});\n")
 
 
-def generate_activities(contact_ids, count):
+def generate_activities(out, contact_ids, count):
     """Generate activity INSERT statements."""
     print(f"-- Generating {count} activities", file=sys.stderr)
-    print("\n-- Activities")
+    out.write("\n-- Activities\n")
 
     activity_subjects = {
         'call': ['Initial discovery call', 'Follow-up call', 'Product discussion', 'Pricing call', 'Check-in call', 'Support call'],
@@ -256,23 +425,30 @@ def generate_activities(contact_ids, count):
         'follow_up': ['Post-meeting follow-up', 'Proposal follow-up', 'Contract follow-up', 'Decision check-in', 'Next steps discussion'],
     }
 
+    subjects_sql = {t: tuple(escape_sql(s) for s in subjects) for t, subjects in activity_subjects.items()}
+    activity_types = random.choices(ACTIVITY_TYPES, k=count)
+    picked_contacts = random.choices(contact_ids, k=count)
+
+    rows = []
     for i in range(1, count + 1):
-        contact_id = random.choice(contact_ids)
-        activity_type = random.choice(ACTIVITY_TYPES)
-        subject = escape_sql(random.choice(activity_subjects[activity_type]))
-        notes = escape_sql(fake.paragraph(nb_sentences=3)) if random.random() > 0.3 else 'NULL'
+        contact_id = picked_contacts[i - 1]
+        activity_type = activity_types[i - 1]
+        subject = random.choice(subjects_sql[activity_type])
+        notes = escape_sql(paragraph(3)) if random.random() > 0.3 else 'NULL'
         duration = random.randint(5, 120) if activity_type in ('call', 'meeting', 'demo') else 'NULL'
-        activity_date = escape_sql(fake.date_time_between(start_date='-1y', end_date='now'))
+        activity_date = "'" + fast_dt(365) + "'"
+
+        rows.append(f"({i}, {contact_id}, {ACTIVITY_TYPES_SQL[activity_type]}, {subject}, {notes}, {duration}, {activity_date})")
 
-        print(f"INSERT INTO activities (id, contact_id, type, subject, notes, duration_minutes, activity_date) VALUES ({i}, {contact_id}, {escape_sql(activity_type)}, {subject}, {notes}, {duration}, {activity_date});")
+    emit_batch(out, ACTIVITIES_INSERT, rows)
 
-    print(f"SELECT setval('activities_id_seq', {count});")
+    out.write(f"SELECT setval('activities_id_seq', {count});\n")
 
 
-def generate_notes(contact_ids, count):
+def generate_notes(out, contact_ids, count):
     """Generate note INSERT statements."""
     print(f"-- Generating {count} notes", file=sys.stderr)
-    print("\n-- Notes")
+    out.write("\n-- Notes\n")
 
     note_templates = [
         "Spoke with {name} about their current challenges. They mentioned {topic}.",
@@ -285,35 +461,46 @@ def generate_notes(contact_ids, count):
         "Budget: {budget}. Timeline: {timeline}.",
     ]
 
+    templates = random.choices(note_templates, k=count)
+    roles = random.choices(('CEO', 'CTO', 'CFO', 'VP', 'Director'), k=count)
+    depts = random.choices(('Finance', 'IT', 'Operations', 'Executive'), k=count)
+    times = random.choices(('morning', 'afternoon', 'after 3pm'), k=count)
+    product_tiers = random.choices(('Pro', 'Enterprise'), k=count)
+    product_kinds = random.choices(('Suite', 'Platform'), k=count)
+    picked_contacts = random.choices(contact_ids, k=count)
+
+    rows = []
     for i in range(1, count + 1):
-        contact_id = random.choice(contact_ids)
-        template = random.choice(note_templates)
+        contact_id = picked_contacts[i - 1]
+        template = templates[i - 1]
 
         content = template.format(
-            name=fake.name(),
+            name=person.full_name(),
             topic=fake.bs(),
-            role=random.choice(['CEO', 'CTO', 'CFO', 'VP', 'Director']),
-            dept=random.choice(['Finance', 'IT', 'Operations', 'Executive']),
-            time=random.choice(['morning', 'afternoon', 'after 3pm']),
-            competitor=fake.company(),
+            role=roles[i - 1],
+            dept=depts[i - 1],
+            time=times[i - 1],
+            competitor=finance.company(),
             feature=fake.bs(),
-            product=f"{random.choice(['Pro', 'Enterprise'])} {random.choice(['Suite', 'Platform'])}",
+            product=f"{product_tiers[i - 1]} {product_kinds[i - 1]}",
             date=fake.date_between(start_date='today', end_date='+30d').strftime('%B %d'),
             requirements=fake.bs(),
             budget=f"${random.randint(10, 500)}K",
             timeline=f"{random.randint(1, 6)} months",
         )
 
-        created_at = escape_sql(fake.date_time_between(start_date='-1y', end_date='now'))
-        print(f"INSERT INTO notes (id, contact_id, content, created_at) VALUES ({i}, {contact_id}, {escape_sql(content)}, {created_at});")
+        created_at = "'" + fast_dt(365) + "'"
+        rows.append(f"({i}, {contact_id}, {escape_sql(content)}, {created_at})")
 
-    print(f"SELECT setval('notes_id_seq', {count});")
+    emit_batch(out, NOTES_INSERT, rows)
 
+    out.write(f"SELECT setval('notes_id_seq', {count});\n")
 
-def generate_tasks(deal_ids, count):
+
+def generate_tasks(out, deal_ids, count):
     """Generate task INSERT statements."""
     print(f"-- Generating {count} tasks", file=sys.stderr)
-    print("\n-- Tasks")
+    out.write("\n-- Tasks\n")
 
     task_templates = [
         ('Send proposal to client', 'Prepare and send detailed proposal with pricing'),
@@ -328,48 +515,90 @@ def generate_tasks(deal_ids, count):
         ('Follow up on outstanding questions', 'Address customer concerns'),
     ]
 
+    templates_sql = [(escape_sql(title), escape_sql(description)) for title, description in task_templates]
+    templates = random.choices(templates_sql, k=count)
+    priorities = random.choices(TASK_PRIORITIES_SQL, k=count)
+    statuses = random.choices(TASK_STATUSES, weights=[30, 20, 40, 10], k=count)
+    picked_deals = random.choices(deal_ids, k=count)
+
+    rows = []
     for i in range(1, count + 1):
-        deal_id = random.choice(deal_ids)
-        title, description = random.choice(task_templates)
+        deal_id = picked_deals[i - 1]
+        title, description = templates[i - 1]
 
-        status = random.choices(TASK_STATUSES, weights=[30, 20, 40, 10], k=1)[0]
-        priority = random.choice(TASK_PRIORITIES)
+        status = statuses[i - 1]
+        priority = priorities[i - 1]
         due_date = fake.date_between(start_date='-30d', end_date='+60d')
 
         completed_at = 'NULL'
         if status == 'completed':
-            completed_at = escape_sql(fake.date_time_between(
-                start_date=due_date - timedelta(days=7),
-                end_date=min(due_date + timedelta(days=3), datetime.now().date())
-            ))
+            window_start = datetime.combine(due_date - timedelta(days=7), datetime.min.time())
+            window_end = datetime.combine(min(due_date + timedelta(days=3), datetime.now().date()), datetime.min.time())
+            # A task due more than a week out can't have been completed in the future
+            window_start = min(window_start, window_end)
+            completed_at = "'" + random_dt(int(window_start.timestamp()), int(window_end.timestamp())) + "'"
+
+        created_at = "'" + fast_dt(60) + "'"
 
-        created_at = escape_sql(fake.date_time_between(start_date='-2m', end_date='now'))
+        rows.append(f"({i}, {deal_id}, {title}, {description}, {escape_sql(due_date)}, {TASK_STATUSES_SQL[status]}, {priority}, {completed_at}, {created_at})")
 
-        print(f"INSERT INTO tasks (id, deal_id, title, description, due_date, status, priority, completed_at, created_at) VALUES ({i}, {deal_id}, {escape_sql(title)}, {escape_sql(description)}, {escape_sql(due_date)}, {escape_sql(status)}, {escape_sql(priority)}, {completed_at}, {created_at});")
+    emit_batch(out, TASKS_INSERT, rows)
 
-    print(f"SELECT setval('tasks_id_seq', {count});")
+    out.write(f"SELECT setval('tasks_id_seq', {count});\n")
 
 
 def main():
     """Generate SQL insert statements for all CRM data."""
-    print("-- CRM Sample Data")
-    print("-- Generated by generate_data_sql.py")
-    print(f"-- Generated at: {datetime.now().isoformat()}")
-    print("")
-    print("BEGIN;")
-
-    # Generate data in dependency order
-    company_ids = generate_companies(CONFIG['companies'])
-    contact_ids, contact_company_map = generate_contacts(company_ids, CONFIG['contacts'])
-    product_ids, product_prices = generate_products(CONFIG['products'])
-    deal_ids = generate_deals(company_ids, contact_ids, contact_company_map, CONFIG['deals'])
-    generate_deal_products(deal_ids, product_ids, product_prices, CONFIG['deal_products'])
-    generate_activities(contact_ids, CONFIG['activities'])
-    generate_notes(contact_ids, CONFIG['notes'])
-    generate_tasks(deal_ids, CONFIG['tasks'])
-
-    print("")
-    print("COMMIT;")
+    # Every line of SQL, including comments and the transaction wrapper, goes
+    # through buf; the header is flushed together with the companies table
+    buf = io.StringIO()
+    buf.write(
+        "-- CRM Sample Data\n"
+        "-- Generated by generate_data_sql.py\n"
+        f"-- Generated at: {datetime.now().isoformat()}\n"
+        "\n"
+        "BEGIN;\n"
+    )
+
+    # Fork workers where possible so they inherit the already-initialized Faker
+    # and Mimesis providers instead of re-importing and rebuilding them
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = multiprocessing.get_context()
+
+    with ProcessPoolExecutor(max_workers=3, mp_context=mp_context) as executor:
+        # Products, activities and notes only need ids that exist up front or
+        # once contacts are generated, so build their SQL in worker processes
+        products_future = executor.submit(generate_in_worker, 43, generate_products, CONFIG['products'])
+
+        # Generate data in dependency order, flushing once per table
+        company_ids = generate_companies(buf, CONFIG['companies'])
+        flush_output(buf)
+        contact_ids, contact_company_map = generate_contacts(buf, company_ids, CONFIG['contacts'])
+        flush_output(buf)
+
+        activities_future = executor.submit(generate_in_worker, 44, generate_activities, contact_ids, CONFIG['activities'])
+        notes_future = executor.submit(generate_in_worker, 45, generate_notes, contact_ids, CONFIG['notes'])
+
+        deal_ids = generate_deals(buf, company_ids, contact_ids, contact_company_map, CONFIG['deals'])
+        flush_output(buf)
+        products_sql, (product_ids, product_prices) = products_future.result()
+        buf.write(products_sql)
+        flush_output(buf)
+        generate_deal_products(buf, deal_ids, product_ids, product_prices, CONFIG['deal_products'])
+        flush_output(buf)
+        generate_tasks(buf, deal_ids, CONFIG['tasks'])
+        flush_output(buf)
+        activities_sql, _ = activities_future.result()
+        buf.write(activities_sql)
+        flush_output(buf)
+        notes_sql, _ = notes_future.result()
+        buf.write(notes_sql)
+
+    buf.write("\n")
+    buf.write("COMMIT;\n")
+    flush_output(buf)
     print(f"-- Generation complete", file=sys.stderr)
 
 